@@ -6,45 +6,121 @@ and coordinates the redraw cycle.
 """
 
 from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from cmu_graphics import rgb
-from . import model
+from . import model, view
+
+@dataclass(slots=True, frozen=True)
+class Box:
+    """Layout rectangle with far edges precomputed for cheap hit tests."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+    right: int
+    bottom: int
+    inv_width: float
+
+    @classmethod
+    def make(cls, left: int, top: int, width: int, height: int) -> Box:
+        return cls(left, top, width, height, left + width, top + height,
+                   1.0 / width if width else 0.0)
+
+    def __iter__(self):
+        # Views unpack layout boxes as (left, top, width, height) tuples.
+        yield from (self.left, self.top, self.width, self.height)
+
+@lru_cache(maxsize=64)
+def _rgb(r: int, g: int, b: int):
+    """Memoized rgb() so repeated tuples share one color object."""
+
+    return rgb(r, g, b)
+
+# Built once at import so app_started only hands out a reference instead of
+# re-crossing the cmu_graphics boundary for every swatch on each launch.
+_COLORS = {
+    "background": _rgb(245, 246, 250),
+    "panel": _rgb(230, 235, 245),
+    "panelBorder": _rgb(202, 210, 226),
+    "canvas": _rgb(255, 255, 255),
+    "canvasBorder": _rgb(214, 220, 235),
+    "axis": _rgb(120, 132, 148),
+    "axisSubtle": _rgb(151, 163, 178),
+    "curve": _rgb(58, 87, 232),
+    "slice": _rgb(58, 87, 232),
+    "sliceHighlight": _rgb(245, 94, 138),
+    "sliceBorder": _rgb(41, 57, 125),
+    "ribbon": _rgb(33, 46, 82),
+    "ribbonText": _rgb(248, 250, 255),
+    "sidebarHeading": _rgb(33, 46, 82),
+    "sidebarLabel": _rgb(80, 92, 110),
+    "sidebarValue": _rgb(25, 35, 58),
+}
+
+def _compute_layout(width: int, height: int) -> dict:
+    """Layout boxes from integer ratios; runs once per window size."""
+
+    return {
+        "graph": Box.make(80, 120, width * 6 // 10, height * 72 // 100),
+        "sidebar": Box.make(width * 72 // 100, 120, width * 24 // 100, height * 72 // 100),
+        "ribbon": Box.make(0, 40, width, 60),
+    }
 
 def app_started(app) -> None:
     """Initialises global app data and shared layout constants."""
     app.state = model.create_initial_state()
-    app.cache = {"buttons": {}}
+    app.cache = {"buttons": {}, "buttonGrid": {}}
 
-    app.layout = {
-        "graph": (80, 120, int(app.width * 0.6), int(app.height * 0.72)),
-        "sidebar": (int(app.width * 0.72), 120, int(app.width * 0.24), int(app.height * 0.72)),
-        "ribbon": (0, 40, app.width, 60),
-    }
-    app.colors = {
-        "background": rgb(245, 246, 250),
-        "panel": rgb(230, 235, 245),
-        "panelBorder": rgb(202, 210, 226),
-        "canvas": rgb(255, 255, 255),
-        "canvasBorder": rgb(214, 220, 235),
-        "axis": rgb(120, 132, 148),
-        "axisSubtle": rgb(151, 163, 178),
-        "curve": rgb(58, 87, 232),
-        "slice": rgb(58, 87, 232),
-        "sliceHighlight": rgb(245, 94, 138),
-        "sliceBorder": rgb(41, 57, 125),
-        "ribbon": rgb(33, 46, 82),
-        "ribbonText": rgb(248, 250, 255),
-        "sidebarHeading": rgb(33, 46, 82),
-        "sidebarLabel": rgb(80, 92, 110),
-        "sidebarValue": rgb(25, 35, 58),
-    }
+    app.layout = _compute_layout(app.width, app.height)
+    # Bound once so the click handlers read one attribute instead of
+    # chasing app.layout["graph"] on every event.
+    app._graph = app.layout["graph"]
+    app.colors = _COLORS
 
     app.stepsPerSecond = 15
 
-def key_pressed(app, event) -> None:
+def _print_volume(state) -> None:
+    print(f"Current approximate volume: {state.approx_volume:.4f} units^3")
+
+# Upper-case aliases are listed explicitly instead of lowering the key at
+# dispatch time: "a" cycles functions while "A" runs adaptive refinement,
+# so a blanket key.lower() would merge two different commands.
+_KEY_HANDLERS = {
+    "left": lambda state: model.cycle_function(state, -1),
+    "a": lambda state: model.cycle_function(state, -1),
+    "right": lambda state: model.cycle_function(state, +1),
+    "d": lambda state: model.cycle_function(state, +1),
+    "[": lambda state: model.adjust_domain(state, -0.1, 0),
+    "]": lambda state: model.adjust_domain(state, 0, 0.1),
+    "{": lambda state: model.adjust_domain(state, -0.25, 0),
+    "}": lambda state: model.adjust_domain(state, 0, 0.25),
+    "+": lambda state: model.adjust_slice_count(state, +1),
+    "=": lambda state: model.adjust_slice_count(state, +1),
+    "-": lambda state: model.adjust_slice_count(state, -1),
+    "_": lambda state: model.adjust_slice_count(state, -1),
+    "up": lambda state: model.adjust_slice_count(state, +2),
+    "down": lambda state: model.adjust_slice_count(state, -2),
+    "space": model.toggle_animation,
+    "n": model.begin_custom_function_entry,
+    "N": model.begin_custom_function_entry,
+    "v": model.start_video_playback,
+    "V": model.start_video_playback,
+    "A": model.run_adaptive_refinement,
+    "g": model.apply_adaptive_slice_recommendation,
+    "G": model.apply_adaptive_slice_recommendation,
+    "t": model.cycle_adaptive_tolerance,
+    "T": model.cycle_adaptive_tolerance,
+    "3": model.toggle_display_mode,
+    "r": model.reset_state,
+    "p": _print_volume,
+}
+
+def key_pressed(app, key) -> None:
     """Delegates key events to the model."""
 
-    key = event.key
     state = app.state
 
     if state.input_stage != "idle":
@@ -60,58 +136,23 @@ def key_pressed(app, event) -> None:
                 model.append_input_character(state, char)
         return
 
-    if key in ("left", "a"):
-        model.cycle_function(state, -1)
-    elif key in ("right", "d"):
-        model.cycle_function(state, +1)
-    elif key == "[":
-        model.adjust_domain(state, -0.1, 0)
-    elif key == "]":
-        model.adjust_domain(state, 0, 0.1)
-    elif key in ("{",):
-        model.adjust_domain(state, -0.25, 0)
-    elif key in ("}",):
-        model.adjust_domain(state, 0, 0.25)
-    elif key in ("+", "="):
-        model.adjust_slice_count(state, +1)
-    elif key in ("-", "_"):
-        model.adjust_slice_count(state, -1)
-    elif key in ("up",):
-        model.adjust_slice_count(state, +2)
-    elif key in ("down",):
-        model.adjust_slice_count(state, -2)
-    elif key == "space":
-        model.toggle_animation(state)
-    elif key.lower() == "n":
-        model.begin_custom_function_entry(state)
-    elif key.lower() == "v":
-        model.start_video_playback(state)
-    elif key.lower() == "a":
-        model.run_adaptive_refinement(state)
-    elif key.lower() == "g":
-        model.apply_adaptive_slice_recommendation(state)
-    elif key.lower() == "t":
-        model.cycle_adaptive_tolerance(state)
-    elif key == "3":
-        model.toggle_display_mode(state)
-    elif key == "r":
-        model.reset_state(state)
-    elif key == "p":
-        print(f"Current approximate volume: {state.approx_volume:.4f} units^3")
+    handler = _KEY_HANDLERS.get(key)
+    if handler is not None:
+        handler(state)
 
-def mouse_pressed(app, event) -> None:
+def mouse_pressed(app, x, y) -> None:
     """
     Clicking inside the graph toggles animation focusing on the nearest slice.
     Clicking elsewhere simply toggles animation.
     """
 
-    graph_left, graph_top, graph_width, graph_height = app.layout["graph"]
+    graph = app._graph
     state = app.state
 
     if state.input_stage != "idle":
         return
 
-    button_hit = _button_hit(app, event.x, event.y)
+    button_hit = _button_hit(app, x, y)
     if button_hit == "play":
         model.start_video_playback(state)
         return
@@ -131,79 +172,71 @@ def mouse_pressed(app, event) -> None:
         model.apply_adaptive_slice_recommendation(state)
         return
 
-    if (
-        graph_left <= event.x <= graph_left + graph_width
-        and graph_top <= event.y <= graph_top + graph_height
-    ):
-        focus_index = _index_for_x(app, event.x)
-        if focus_index is not None:
-            step_fraction = focus_index / max(1, state.slice_count)
-            state.rotation_angle = step_fraction * 360
-            state.is_animating = True
+    if graph.left <= x <= graph.right and graph.top <= y <= graph.bottom:
+        focus_index = _index_for_x(app, x)
+        step_fraction = focus_index / max(1, state.slice_count)
+        state.rotation_angle = step_fraction * 360
+        state.is_animating = True
     else:
         model.toggle_animation(state)
 
-def on_mouse_drag(app, mouseX: float, mouseY: float) -> None:
-    """Currently a no-op placeholder to satisfy cmu_graphics' drag hook."""
-
-    _ = (app, mouseX, mouseY)
-
-def on_mouse_release(app, event) -> None:
-    """No-op placeholder to keep the release hook balanced with on_mouse_drag."""
+# cmu_graphics only requires these hooks to be callable; a shared no-op
+# keeps drag events (which fire at input-device rate) as cheap as possible.
+_NOOP = lambda *_args: None
 
-    _ = (app, event)
+on_mouse_drag = _NOOP
+on_mouse_release = _NOOP
 
 def timer_fired(app) -> None:
     """Keeps the animation advancing smoothly."""
 
     state = app.state
+    if not state.is_animating:
+        return
     speed = 5.0 if state.play_mode == "video" else 4.0
     model.tick_animation(state, degrees_per_tick=speed)
 
 def redraw_all(app) -> None:
     """Redirects the view call; defined for symmetry."""
 
-    from . import view
-
-    app.cache.setdefault("buttons", {})
     view.redraw_all(app)
 
-def _index_for_x(app, x_pixel: float):
-    """Converts a screen x-position into a slice index."""
+def _index_for_x(app, x_pixel: float) -> int:
+    """Converts an in-bounds screen x-position into a clamped slice index.
 
-    state = app.state
-    graph_left, _, graph_width, _ = app.layout["graph"]
+    Callers are expected to have bounds-checked the click already, so the
+    result is always a valid index and no None branch is needed.
+    """
 
-    relative = (x_pixel - graph_left) / graph_width
-    if not 0 <= relative <= 1:
-        return None
-    return min(state.slice_count - 1, max(0, int(relative * state.slice_count)))
+    state = app.state
+    graph = app._graph
+
+    index = int((x_pixel - graph.left) * graph.inv_width * state.slice_count)
+    if index < 0:
+        return 0
+    last = state.slice_count - 1
+    return last if index > last else index
+
+_KEY_CHAR_MAP = {
+    "space": " ",
+    "minus": "-",
+    "equal": "=",
+    "slash": "/",
+    "period": ".",
+    "comma": ",",
+    "apostrophe": "'",
+    "semicolon": ";",
+    "leftBracket": "[",
+    "rightBracket": "]",
+    "backslash": "\\",
+}
 
 def _key_to_char(key: str) -> Optional[str]:
     """Map cmu_graphics key strings to the characters we allow in text input."""
 
-    if len(key) == 1:
-        return key
-    mapping = {
-        "space": " ",
-        "minus": "-",
-        "equal": "=",
-        "slash": "/",
-        "period": ".",
-        "comma": ",",
-        "apostrophe": "'",
-        "semicolon": ";",
-        "leftBracket": "[",
-        "rightBracket": "]",
-        "backslash": "\\",
-    }
-    return mapping.get(key)
+    return key if len(key) == 1 else _KEY_CHAR_MAP.get(key)
 
 def _button_hit(app, x: float, y: float) -> Optional[str]:
     """Return the identifier of the button under the cursor, if any."""
 
-    buttons = app.cache.get("buttons", {})
-    for name, (bx, by, bw, bh) in buttons.items():
-        if bx <= x <= bx + bw and by <= y <= by + bh:
-            return name
-    return None
+    return view.button_hit(app, x, y)
@@ -6,8 +6,9 @@ The controller calls `redraw_all` from the main `redrawAll` handler.
 """
 
 from __future__ import annotations
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 import math
+from operator import itemgetter
 
 from cmu_graphics import (
     drawLine,
@@ -31,6 +32,7 @@ def redraw_all(app) -> None:
         return
 
     app.cache["buttons"] = {}
+    app.cache["buttonGrid"] = {}
 
     draw_background(app)
     draw_plot(app)
@@ -66,10 +68,20 @@ def draw_background(app) -> None:
 
 def draw_plot(app) -> None:
     state = app.state
-    points, radius_max = model.curve_points_and_radius(state)
-    y_min, y_max = compute_vertical_bounds(points, radius_max)
+    # Resampling only happens when state.version moved; animation ticks
+    # and overlay typing reuse the cached curve.
+    cached = app.cache.get("curve")
+    if cached is not None and cached[0] == state.version:
+        _, xs, ys, radius_max = cached
+    else:
+        xs, ys, radius_max = model.curve_points_arrays(state)
+        app.cache["curve"] = (state.version, xs, ys, radius_max)
+    # zip reuses its result tuple while the consumer does not retain it,
+    # so the pair-based bounds helper stays allocation-light on SoA data.
+    y_min, y_max = compute_vertical_bounds(zip(xs, ys), radius_max)
     app.cache["yRange"] = (y_min, y_max)
     app.cache["radiusMax"] = radius_max
+    _prepare_screen_xform(app)
 
     graph_left, graph_top, graph_width, graph_height = app.layout["graph"]
 
@@ -83,23 +95,34 @@ def draw_plot(app) -> None:
         borderWidth=1,
     )
 
-    draw_axes(app, y_min, y_max)
-
-    if len(points) > 1:
-        for pt_a, pt_b in zip(points[:-1], points[1:]):
-            drawLine(
-                *to_screen(app, pt_a),
-                *to_screen(app, pt_b),
-                fill=app.colors["curve"],
-                lineWidth=2,
-            )
-
-    if state.show_3d and radius_max > 0:
+    # In 3D mode draw_surface_mesh finishes by drawing the axes on top
+    # of the quads, so the pre-curve pass here would be painted over
+    # anyway — skip it and only pay for axes once per frame.
+    will_draw_mesh = state.show_3d and radius_max > 0 and len(xs) > 1
+    if not will_draw_mesh:
+        draw_axes(app, y_min, y_max)
+
+    if len(xs) > 1:
+        # Transform the whole curve in one comprehension against the
+        # frame's affine scalars instead of paying to_screen's lookups
+        # twice per segment; the loop then only issues drawLine calls.
+        ax, bx, ay, by = app.cache["screenXform"]
+        coords = [(ax + x * bx, ay - y * by) for x, y in zip(xs, ys)]
+        curve_color = app.colors["curve"]
+        for i in range(len(coords) - 1):
+            sx0, sy0 = coords[i]
+            sx1, sy1 = coords[i + 1]
+            drawLine(sx0, sy0, sx1, sy1, fill=curve_color, lineWidth=2)
+
+    if will_draw_mesh:
         try:
-            draw_surface_mesh(app, points, radius_max)
+            draw_surface_mesh(app, xs, ys, radius_max)
         except Exception as exc:
             state.show_3d = False
             state.message = f"3D preview unavailable: {exc}"
+            # The mesh never reached its axis pass, so the fallback
+            # frame still needs one before the slices.
+            draw_axes(app, y_min, y_max)
             draw_slices(app)
     else:
         draw_slices(app)
@@ -111,70 +134,86 @@ def draw_plot(app) -> None:
 
 def draw_axes(app, y_min: float, y_max: float) -> None:
     state = app.state
+    # Work straight off the affine coefficients: under the transform the
+    # x = 0 line sits at ax and the y = 0 line at ay, and every tick
+    # shares the same screen edge, so to_screen adds nothing here.
+    ax, bx, ay, by = app.cache["screenXform"]
+    axis_color = app.colors["axis"]
+    subtle_color = app.colors["axisSubtle"]
+    sx_start = ax + state.domain_start * bx
+    sx_end = ax + state.domain_end * bx
+    sy_bottom = ay - y_min * by
+    sy_top = ay - y_max * by
 
     if y_min <= 0 <= y_max:
-        x0, y0 = to_screen(app, (state.domain_start, 0))
-        x1, y1 = to_screen(app, (state.domain_end, 0))
-        drawLine(x0, y0, x1, y1, fill=app.colors["axis"], lineWidth=1)
+        drawLine(sx_start, ay, sx_end, ay, fill=axis_color, lineWidth=1)
 
     if state.domain_start <= 0 <= state.domain_end:
-        y0 = to_screen(app, (0, y_min))[1]
-        y1 = to_screen(app, (0, y_max))[1]
-        x = to_screen(app, (0, 0))[0]
-        drawLine(x, y0, x, y1, fill=app.colors["axis"], lineWidth=1)
+        drawLine(ax, sy_bottom, ax, sy_top, fill=axis_color, lineWidth=1)
 
+    x_span = state.domain_end - state.domain_start
+    y_span = y_max - y_min
     for i in range(5):
         t = i / 4
-        x = state.domain_start + t * (state.domain_end - state.domain_start)
-        sx, sy0 = to_screen(app, (x, y_min))
-        _, sy1 = to_screen(app, (x, y_max))
-        drawLine(sx, sy0, sx, sy0 + 6, fill=app.colors["axis"])
-        drawLabel(f"{x:.2f}", sx, sy0 + 16, size=10, fill=app.colors["axisSubtle"])
-
-        y = y_min + t * (y_max - y_min)
-        sx0, sy = to_screen(app, (state.domain_start, y))
-        sx1, _ = to_screen(app, (state.domain_end, y))
-        drawLine(sx0 - 6, sy, sx0, sy, fill=app.colors["axis"])
-        drawLabel(f"{y:.2f}", sx0 - 28, sy + 2, size=10, fill=app.colors["axisSubtle"])
+        x = state.domain_start + t * x_span
+        sx = ax + x * bx
+        drawLine(sx, sy_bottom, sx, sy_bottom + 6, fill=axis_color)
+        drawLabel(f"{x:.2f}", sx, sy_bottom + 16, size=10, fill=subtle_color)
+
+        y = y_min + t * y_span
+        sy = ay - y * by
+        drawLine(sx_start - 6, sy, sx_start, sy, fill=axis_color)
+        drawLabel(f"{y:.2f}", sx_start - 28, sy + 2, size=10, fill=subtle_color)
 
 def draw_slices(app) -> None:
     state = app.state
-    slices = model.slice_samples(state)
+    cached = app.cache.get("slices")
+    if cached is not None and cached[0] == state.version:
+        slices = cached[1]
+    else:
+        slices = model.slice_samples(state)
+        app.cache["slices"] = (state.version, slices)
     if not slices:
         return
     dx = (state.domain_end - state.domain_start) / state.slice_count
     highlight_index = model.compute_highlight_index(state)
 
+    # Each slice is an axis-aligned rect under the transform: both top
+    # corners share one y and the sides share their x, so four inline
+    # multiply-adds replace the four to_screen calls per slice.
+    ax, bx, ay, by = app.cache["screenXform"]
+    half_dx = 0.5 * dx
+    sy0 = ay
+    slice_fill = app.colors["slice"]
+    highlight_fill = app.colors["sliceHighlight"]
+    border = app.colors["sliceBorder"]
+
     for index, (x_mid, radius) in enumerate(slices):
-        x_left = x_mid - 0.5 * dx
-        x_right = x_mid + 0.5 * dx
-        sx0, sy0 = to_screen(app, (x_left, 0))
-        sx1, _ = to_screen(app, (x_right, 0))
-        sx2, sy2 = to_screen(app, (x_right, radius))
-        sx3, sy3 = to_screen(app, (x_left, radius))
+        sx0 = ax + (x_mid - half_dx) * bx
+        sx1 = ax + (x_mid + half_dx) * bx
+        sy_top = ay - radius * by
 
-        fill = app.colors["sliceHighlight"] if index == highlight_index else app.colors["slice"]
-        border = app.colors["sliceBorder"]
-        opacity = 55 if index == highlight_index else 28
+        is_highlight = index == highlight_index
+        fill = highlight_fill if is_highlight else slice_fill
 
         drawPolygon(
             sx0,
             sy0,
             sx1,
             sy0,
-            sx2,
-            sy2,
-            sx3,
-            sy3,
+            sx1,
+            sy_top,
+            sx0,
+            sy_top,
             fill=fill,
             border=border,
-            opacity=opacity,
+            opacity=55 if is_highlight else 28,
         )
 
         ellipse_width = abs(sx1 - sx0)
         ellipse_height = max(4, ellipse_width * 0.25)
         cx = (sx0 + sx1) / 2
-        cy = sy3 - ellipse_height / 2
+        cy = sy_top - ellipse_height / 2
         drawOval(
             cx,
             cy,
@@ -182,20 +221,30 @@ def draw_slices(app) -> None:
             ellipse_height,
             fill=fill,
             border=border,
-            opacity=65 if index == highlight_index else 40,
+            opacity=65 if is_highlight else 40,
         )
 
-def draw_surface_mesh(app, points: List[Tuple[float, float]], radius_max: float) -> None:
+def draw_surface_mesh(app, xs: List[float], ys: List[float], radius_max: float) -> None:
     state = app.state
-    if len(points) < 2 or radius_max <= 0:
+    if len(xs) < 2 or radius_max <= 0:
         return
 
-    step = max(1, len(points) // 80)
-    sampled = points[::step]
-    if sampled[-1] != points[-1]:
-        sampled.append(points[-1])
+    step = max(1, len(xs) // 80)
+    sampled_x = xs[::step]
+    sampled_y = ys[::step]
+    if sampled_x[-1] != xs[-1]:
+        sampled_x.append(xs[-1])
+        sampled_y.append(ys[-1])
 
     theta_steps = 18
+    # Only theta_steps + 1 distinct angles exist, yet the inner loop was
+    # paying four trig calls per quad; table them once up front, with
+    # the step premultiplied so the build divides once instead of per
+    # entry.
+    dtheta = math.pi / theta_steps
+    angles = [j * dtheta for j in range(theta_steps + 1)]
+    sins = [math.sin(a) for a in angles]
+    coss = [math.cos(a) for a in angles]
     highlight_index = model.compute_highlight_index(state)
     domain_span = state.domain_end - state.domain_start or 1
     graph_left, graph_top, graph_width, graph_height = app.layout["graph"]
@@ -204,48 +253,49 @@ def draw_surface_mesh(app, points: List[Tuple[float, float]], radius_max: float)
     depth_x = graph_width / domain_span * 0.05
     depth_y = graph_height / y_span * 0.04
 
-    polygons = []
-
-    for seg_index in range(len(sampled) - 1):
-        x0, y0 = sampled[seg_index]
-        x1, y1 = sampled[seg_index + 1]
-        r0 = max(0.0, abs(y0))
-        r1 = max(0.0, abs(y1))
-
-        for j in range(theta_steps):
-            theta0 = j / theta_steps * math.pi
-            theta1 = (j + 1) / theta_steps * math.pi
-            sin0, cos0 = math.sin(theta0), math.cos(theta0)
-            sin1, cos1 = math.sin(theta1), math.cos(theta1)
-
-            p0 = _project_point(app, x0, r0 * cos0, r0 * sin0, depth_x, depth_y)
-            p1 = _project_point(app, x1, r1 * cos0, r1 * sin0, depth_x, depth_y)
-            p2 = _project_point(app, x1, r1 * cos1, r1 * sin1, depth_x, depth_y)
-            p3 = _project_point(app, x0, r0 * cos1, r0 * sin1, depth_x, depth_y)
-
-            avg_depth = (sin0 + sin1) / 2
-            slice_index = min(
-                state.slice_count - 1,
-                max(
-                    0,
-                    int((x0 - state.domain_start) / domain_span * state.slice_count),
-                ),
-            )
-            polygons.append(
-                (
-                    avg_depth,
-                    slice_index == highlight_index,
-                    (p0, p1, p2, p3),
-                    j,
-                )
-            )
-
-    polygons.sort(key=lambda item: item[0])
+    # cmu_graphics clears the canvas every frame, so the draw calls
+    # below must always be issued — but the build-and-sort only depends
+    # on the state version and the highlighted slice, so frames where
+    # neither moved reuse the previous quad list outright.
+    mesh_key = (state.version, highlight_index)
+    cached_mesh = app.cache.get("mesh")
+    if cached_mesh is not None and cached_mesh[0] == mesh_key:
+        polygons = cached_mesh[1]
+    else:
+        ax, bx, ay, by = app.cache["screenXform"]
+        polygons = _build_mesh(
+            sampled_x,
+            sampled_y,
+            sins,
+            coss,
+            ax,
+            bx,
+            ay,
+            by,
+            depth_x,
+            depth_y,
+            state.domain_start,
+            domain_span,
+            state.slice_count,
+            highlight_index,
+            app.width * 4,
+            app.height * 4,
+        )
+        # itemgetter runs the key extraction in C; the lambda was
+        # costing a Python frame per element on a ~1400-quad sort.
+        polygons.sort(key=itemgetter(0))
+        app.cache["mesh"] = (mesh_key, polygons)
+
+    # Only theta_steps distinct opacities exist; table them instead of
+    # re-deriving the same formula for every quad. Colors hoist too.
+    opacity_table = [int(25 + 30 * (1 - j / theta_steps)) for j in range(theta_steps)]
+    slice_color = app.colors["slice"]
+    highlight_color = app.colors["sliceHighlight"]
+    border = app.colors["sliceBorder"]
 
     for depth, is_highlight, corners, theta_index in polygons:
-        color = app.colors["sliceHighlight"] if is_highlight else app.colors["slice"]
-        border = app.colors["sliceBorder"]
-        opacity = 60 if is_highlight else int(25 + 30 * (1 - theta_index / theta_steps))
+        color = highlight_color if is_highlight else slice_color
+        opacity = 60 if is_highlight else opacity_table[theta_index]
         drawPolygon(
             corners[0][0],
             corners[0][1],
@@ -262,6 +312,78 @@ def draw_surface_mesh(app, points: List[Tuple[float, float]], radius_max: float)
 
     draw_axes(app, y_min, y_max)
 
+def _build_mesh(
+    sampled_x: List[float],
+    sampled_y: List[float],
+    sins: List[float],
+    coss: List[float],
+    ax: float,
+    bx: float,
+    ay: float,
+    by: float,
+    depth_x: float,
+    depth_y: float,
+    domain_start: float,
+    domain_span: float,
+    slice_count: int,
+    highlight_index: int,
+    max_pad_x: float,
+    max_pad_y: float,
+) -> List[Tuple[float, bool, Tuple[Tuple[float, float], ...], int]]:
+    """Build the unsorted (depth, highlight, corners, theta) quad list.
+
+    Deliberately a pure function of scalars and lists — no app or state
+    access — so the numeric core stays isolated from the drawing code
+    and could be swapped for a compiled kernel without touching callers.
+    Adjacent quads share their corner vertices, so the whole
+    S x (theta + 1) grid is projected once instead of four times per
+    quad — roughly a quarter of the projection work.
+    """
+
+    theta_steps = len(sins) - 1
+    isfinite = math.isfinite
+    grid: List[List[Tuple[float, float]]] = []
+    for x, y in zip(sampled_x, sampled_y):
+        r = abs(y)
+        sx_base = ax + x * bx
+        row = []
+        for j in range(theta_steps + 1):
+            z = r * sins[j]
+            px = sx_base + z * depth_x
+            py = ay - (r * coss[j]) * by - z * depth_y
+            if not (isfinite(px) and isfinite(py)):
+                raise ValueError("Projected point became non-finite.")
+            if abs(px) > max_pad_x or abs(py) > max_pad_y:
+                raise ValueError("Projected point escaped the drawable area.")
+            row.append((px, py))
+        grid.append(row)
+
+    polygons = []
+
+    for seg_index in range(len(sampled_x) - 1):
+        x0 = sampled_x[seg_index]
+        row0 = grid[seg_index]
+        row1 = grid[seg_index + 1]
+        # Constant across the theta sweep, so compute it per segment.
+        slice_index = min(
+            slice_count - 1,
+            max(0, int((x0 - domain_start) / domain_span * slice_count)),
+        )
+        is_highlight = slice_index == highlight_index
+
+        for j in range(theta_steps):
+            avg_depth = (sins[j] + sins[j + 1]) / 2
+            polygons.append(
+                (
+                    avg_depth,
+                    is_highlight,
+                    (row0[j], row1[j], row1[j + 1], row0[j + 1]),
+                    j,
+                )
+            )
+
+    return polygons
+
 def draw_ribbon(app) -> None:
     ribbon_left, ribbon_top, ribbon_width, ribbon_height = app.layout["ribbon"]
     drawRect(ribbon_left, ribbon_top, ribbon_width, ribbon_height, fill=app.colors["ribbon"])
@@ -321,7 +443,6 @@ def draw_sidebar(app) -> None:
             button_height,
         )
 
-    active_fn = model.active_function(state)
     info_left = sidebar_left + 24
     info_width = sidebar_width - 48
     info_top = button_y + len(button_specs) * (button_height + spacing) + 24
@@ -348,8 +469,8 @@ def draw_sidebar(app) -> None:
     info_top = _draw_info_pairs(
         app,
         [
-            ("Function", active_fn.name),
-            ("Expression", active_fn.expression),
+            ("Function", model.active_name(state)),
+            ("Expression", model.active_expression(state)),
             ("Domain", f"[{state.domain_start:.2f}, {state.domain_end:.2f}]"),
             ("Slices", f"{state.slice_count}"),
             ("Volume (approx)", f"{state.approx_volume:.4f} units³"),
@@ -400,15 +521,17 @@ def draw_status_bar(app) -> None:
         fill=app.colors["sidebarValue"],
     )
 
+# Built once: the overlay redraws on every keystroke while typing, and
+# the prompt strings never change.
+_INPUT_PROMPTS = {
+    "function": "Enter f(x) using sin, cos, exp, sqrt... No 'math.' prefix. Press Enter when done.",
+    "domain_start": "Enter the domain start (a number). Press Enter to continue.",
+    "domain_end": "Enter the domain end (greater than start). Press Enter to finish.",
+}
+
 def draw_input_overlay(app) -> None:
     state = app.state
-    stage = state.input_stage
-    prompts = {
-        "function": "Enter f(x) using sin, cos, exp, sqrt... No 'math.' prefix. Press Enter when done.",
-        "domain_start": "Enter the domain start (a number). Press Enter to continue.",
-        "domain_end": "Enter the domain end (greater than start). Press Enter to finish.",
-    }
-    prompt = prompts.get(stage, "")
+    prompt = _INPUT_PROMPTS.get(state.input_stage, "")
 
     drawRect(0, 0, app.width, app.height, fill="black", opacity=45)
     box_width = app.width * 0.7
@@ -445,10 +568,32 @@ def draw_input_overlay(app) -> None:
         fill=app.colors["axisSubtle"],
     )
 
+BUTTON_GRID_CELL = 64
+
 def draw_button(app, name: str, label: str, x: float, y: float, width: float, height: float) -> None:
     drawRect(x, y, width, height, fill=app.colors["canvas"], border=app.colors["panelBorder"])
     drawLabel(label, x + width / 2, y + height / 2, align="center", size=13, fill=app.colors["sidebarHeading"])
     app.cache["buttons"][name] = (x, y, width, height)
+    grid = app.cache.setdefault("buttonGrid", {})
+    # Edges are precomputed at registration so hit tests only compare.
+    right, bottom = x + width, y + height
+    for col in range(int(x) // BUTTON_GRID_CELL, int(right) // BUTTON_GRID_CELL + 1):
+        for row in range(int(y) // BUTTON_GRID_CELL, int(bottom) // BUTTON_GRID_CELL + 1):
+            grid.setdefault((col, row), []).append((name, x, y, right, bottom))
+
+def button_hit(app, x: float, y: float) -> Optional[str]:
+    """Return the identifier of the button under the cursor, if any."""
+
+    grid = app.cache.get("buttonGrid")
+    if grid:
+        for name, left, top, right, bottom in grid.get((int(x) // BUTTON_GRID_CELL, int(y) // BUTTON_GRID_CELL), ()):
+            if left <= x <= right and top <= y <= bottom:
+                return name
+        return None
+    for name, (bx, by, bw, bh) in app.cache.get("buttons", {}).items():
+        if bx <= x <= bx + bw and by <= y <= by + bh:
+            return name
+    return None
 
 def _draw_info_pairs(
     app,
@@ -484,51 +629,52 @@ def _draw_info_pairs(
 def compute_vertical_bounds(points: Iterable[Tuple[float, float]], radius_padding: float) -> Tuple[float, float]:
     """Expands the raw min/max slightly to keep the graph readable."""
 
-    values = list(y for (_, y) in points)
-    values.extend([0.0, radius_padding, -radius_padding])
-
-    if not values or max(values) == min(values):
+    # Seed the running extremes with the synthetic anchors (zero line
+    # and radius padding), then fold the points in over a single pass
+    # instead of building a list and scanning it four times.
+    y_min = min(0.0, radius_padding, -radius_padding)
+    y_max = max(0.0, radius_padding, -radius_padding)
+    for _, y in points:
+        if y < y_min:
+            y_min = y
+        elif y > y_max:
+            y_max = y
+
+    if y_max == y_min:
         return (-1.0, 1.0)
 
-    y_min = min(values)
-    y_max = max(values)
     if math.isclose(y_min, y_max, abs_tol=1e-6):
         padding = abs(y_min) * 0.1 if y_min != 0 else 0.5
         return (y_min - padding, y_max + padding)
     padding = 0.12 * (y_max - y_min)
     return (y_min - padding, y_max + padding)
 
-def to_screen(app, point: Tuple[float, float]) -> Tuple[float, float]:
-    """Transforms (x, y) coordinates into screen-space pixels."""
+def _prepare_screen_xform(app) -> None:
+    """Fold the graph transform into four scalars once per frame.
+
+    to_screen runs for every slice corner, mesh vertex, and axis tick;
+    each call was re-reading the layout box, the state, and the cached
+    y-range before redoing the span division. Precomputing the affine
+    (ax, bx, ay, by) here leaves the hot path two multiply-adds.
+    """
 
-    x, y = point
     state = app.state
     graph_left, graph_top, graph_width, graph_height = app.layout["graph"]
     y_min, y_max = app.cache["yRange"]
-
     x_span = state.domain_end - state.domain_start or 1
     y_span = y_max - y_min or 1
+    bx = graph_width / x_span
+    ax = graph_left - state.domain_start * bx
+    by = graph_height / y_span
+    ay = graph_top + graph_height + y_min * by
+    app.cache["screenXform"] = (ax, bx, ay, by)
 
-    sx_fraction = (x - state.domain_start) / x_span
-    sy_fraction = (y - y_min) / y_span
-
-    sx = graph_left + sx_fraction * graph_width
-    sy = graph_top + graph_height - sy_fraction * graph_height
-    return (sx, sy)
-
-def _project_point(app, x: float, y: float, z: float, depth_x: float, depth_y: float) -> Tuple[float, float]:
-    """Simple isometric-style projection for the surface preview."""
+def to_screen(app, point: Tuple[float, float]) -> Tuple[float, float]:
+    """Transforms (x, y) coordinates into screen-space pixels."""
 
-    sx, sy = to_screen(app, (x, y))
-    px = sx + z * depth_x
-    py = sy - z * depth_y
-    if not (math.isfinite(px) and math.isfinite(py)):
-        raise ValueError("Projected point became non-finite.")
-    max_pad_x = app.width * 4
-    max_pad_y = app.height * 4
-    if abs(px) > max_pad_x or abs(py) > max_pad_y:
-        raise ValueError("Projected point escaped the drawable area.")
-    return (px, py)
+    ax, bx, ay, by = app.cache["screenXform"]
+    x, y = point
+    return (ax + x * bx, ay - y * by)
 
 def draw_adaptive_intervals(app, overlay_only: bool = False) -> None:
     """Visualise the adaptive Simpson intervals as vertical markers."""
@@ -538,16 +684,19 @@ def draw_adaptive_intervals(app, overlay_only: bool = False) -> None:
         return
 
     y_min, y_max = app.cache["yRange"]
-    bottom = to_screen(app, (state.domain_start, y_min))[1]
-    top = to_screen(app, (state.domain_start, y_max))[1]
-    max_depth = max((depth for _, _, depth in state.adaptive_intervals), default=1)
-    max_depth = max(1, max_depth)
+    # Interval markers only need x positions, so apply the affine's x
+    # half directly instead of building (x, y) tuples through to_screen;
+    # the model maintains the max depth, saving a rescan per frame.
+    ax, bx, ay, by = app.cache["screenXform"]
+    bottom = ay - y_min * by
+    top = ay - y_max * by
+    max_depth = state.adaptive_max_depth
 
     for interval_start, interval_end, depth in state.adaptive_intervals:
         color = app.colors["sliceHighlight"] if depth == max_depth else app.colors["sliceBorder"]
         alpha = 45 if depth == max_depth else 22
-        sx_start = to_screen(app, (interval_start, y_min))[0]
-        sx_end = to_screen(app, (interval_end, y_min))[0]
+        sx_start = ax + interval_start * bx
+        sx_end = ax + interval_end * bx
         drawRect(
             min(sx_start, sx_end),
             min(top, bottom),
@@ -5,7 +5,6 @@ complies with the 15-112 term project pre-MVP restrictions.
 
 """
 
-from types import SimpleNamespace
 from cmu_graphics import app, runApp
 from mvp import controller
 
@@ -13,19 +12,16 @@ def onAppStart(app):
     controller.app_started(app)
 
 def onKeyPress(app, key):
-    event = SimpleNamespace(key=key)
-    controller.key_pressed(app, event)
+    controller.key_pressed(app, key)
 
 def onMousePress(app, mouseX, mouseY):
-    event = SimpleNamespace(x=mouseX, y=mouseY)
-    controller.mouse_pressed(app, event)
+    controller.mouse_pressed(app, mouseX, mouseY)
 
 def onMouseDrag(app, mouseX, mouseY):
     controller.on_mouse_drag(app, mouseX, mouseY)
 
 def onMouseRelease(app, mouseX, mouseY):
-    event = SimpleNamespace(x=mouseX, y=mouseY)
-    controller.on_mouse_release(app, event)
+    controller.on_mouse_release(app, mouseX, mouseY)
 
 def onStep(app):
     controller.timer_fired(app)
@@ -7,104 +7,151 @@ and coordinates the redraw cycle.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 from cmu_graphics import rgb
 
-from . import model
+from . import model, view
+
+
+@dataclass(slots=True, frozen=True)
+class Box:
+    """Layout rectangle with far edges precomputed for cheap hit tests."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+    right: int
+    bottom: int
+    inv_width: float
+
+    @classmethod
+    def make(cls, left: int, top: int, width: int, height: int) -> Box:
+        return cls(left, top, width, height, left + width, top + height,
+                   1.0 / width if width else 0.0)
+
+    def __iter__(self):
+        # Views unpack layout boxes as (left, top, width, height) tuples.
+        yield from (self.left, self.top, self.width, self.height)
+
+@lru_cache(maxsize=64)
+def _rgb(r: int, g: int, b: int):
+    """Memoized rgb() so repeated tuples share one color object."""
+
+    return rgb(r, g, b)
+
+# Built once at import so app_started only hands out a reference instead of
+# re-crossing the cmu_graphics boundary for every swatch on each launch.
+_COLORS = {
+    "background": _rgb(246, 247, 251),
+    "canvas": _rgb(255, 255, 255),
+    "canvasBorder": _rgb(214, 222, 238),
+    "axis": _rgb(140, 150, 170),
+    "curve": _rgb(60, 90, 230),
+    "slice": _rgb(120, 160, 255),
+    "sidebar": _rgb(234, 238, 247),
+    "sidebarText": _rgb(40, 50, 80),
+    "accent": _rgb(247, 103, 131),
+    "ribbon": _rgb(32, 44, 78),
+    "ribbonText": _rgb(248, 250, 255),
+}
+
+
+def _compute_layout(width: int, height: int) -> dict:
+    """Layout boxes from integer ratios; runs once per window size."""
+
+    return {
+        "graph": Box.make(70, 120, width * 6 // 10, height * 65 // 100),
+        "sidebar": Box.make(width * 72 // 100, 120, width * 24 // 100, height * 65 // 100),
+        "ribbon": Box.make(0, 40, width, 60),
+    }
 
 
 def app_started(app) -> None:
     app.state = model.create_initial_state()
     app.cache = {}
-    app.layout = {
-        "graph": (70, 120, int(app.width * 0.6), int(app.height * 0.65)),
-        "sidebar": (int(app.width * 0.72), 120, int(app.width * 0.24), int(app.height * 0.65)),
-        "ribbon": (0, 40, app.width, 60),
-    }
-    app.colors = {
-        "background": rgb(246, 247, 251),
-        "canvas": rgb(255, 255, 255),
-        "canvasBorder": rgb(214, 222, 238),
-        "axis": rgb(140, 150, 170),
-        "curve": rgb(60, 90, 230),
-        "slice": rgb(120, 160, 255),
-        "sidebar": rgb(234, 238, 247),
-        "sidebarText": rgb(40, 50, 80),
-        "accent": rgb(247, 103, 131),
-        "ribbon": rgb(32, 44, 78),
-        "ribbonText": rgb(248, 250, 255),
-    }
+    app.layout = _compute_layout(app.width, app.height)
+    # Bound once so the mouse handler and the per-frame draw helpers
+    # read one attribute instead of chasing app.layout[...] each time.
+    app._graph = app.layout["graph"]
+    app._ribbon = app.layout["ribbon"]
+    app._sidebar = app.layout["sidebar"]
+    app.colors = _COLORS
     app.stepsPerSecond = 15
 
 
-def key_pressed(app, event) -> None:
-    state = app.state
-    key = event.key
-    if key in ("left", "a"):
-        model.cycle_function(state, -1)
-        return
-    if key in ("right", "d"):
-        model.cycle_function(state, 1)
-        return
-    if key == "[":
-        model.adjust_domain(state, -0.2, 0)
-        return
-    if key == "]":
-        model.adjust_domain(state, 0, 0.2)
-        return
-    if key in ("{",):
-        model.adjust_domain(state, -0.5, 0)
-        return
-    if key in ("}",):
-        model.adjust_domain(state, 0, 0.5)
-        return
-    if key in ("+", "="):
-        model.adjust_slice_count(state, 1)
-        return
-    if key in ("-", "_"):
-        model.adjust_slice_count(state, -1)
-        return
-    if key == "space":
-        model.toggle_animation(state)
-        model.set_status(state, "Animation toggled")
-        return
-    if key.lower() == "r":
-        model.reset_state(state)
+def _toggle_with_status(state) -> None:
+    model.toggle_animation(state)
+    model.set_status(state, "Animation toggled")
+
+
+_KEY_HANDLERS = {
+    "left": lambda state: model.cycle_function(state, -1),
+    "a": lambda state: model.cycle_function(state, -1),
+    "right": lambda state: model.cycle_function(state, 1),
+    "d": lambda state: model.cycle_function(state, 1),
+    "[": lambda state: model.adjust_domain(state, -0.2, 0),
+    "]": lambda state: model.adjust_domain(state, 0, 0.2),
+    "{": lambda state: model.adjust_domain(state, -0.5, 0),
+    "}": lambda state: model.adjust_domain(state, 0, 0.5),
+    "+": lambda state: model.adjust_slice_count(state, 1),
+    "=": lambda state: model.adjust_slice_count(state, 1),
+    "-": lambda state: model.adjust_slice_count(state, -1),
+    "_": lambda state: model.adjust_slice_count(state, -1),
+    "space": _toggle_with_status,
+    "r": model.reset_state,
+    "R": model.reset_state,
+}
+
 
+def key_pressed(app, key) -> None:
+    handler = _KEY_HANDLERS.get(key)
+    if handler is not None:
+        handler(app.state)
 
-def mouse_pressed(app, event) -> None:
-    bounds = app.layout["graph"]
-    if not _within(bounds, event.x, event.y):
+
+def mouse_pressed(app, x, y) -> None:
+    graph = app._graph
+    if not _within(graph, x, y):
         model.toggle_animation(app.state)
         return
-    left, _, width, _ = bounds
     span = app.state.x_max - app.state.x_min
-    if width <= 0 or span <= 0:
+    if graph.width <= 0 or span <= 0:
         return
-    relative = max(0.0, min(1.0, (event.x - left) / width))
+    relative = max(0.0, min(1.0, (x - graph.left) * graph.inv_width))
     app.state.rotation_angle = relative * 360
     app.state.is_animating = False
     model.set_status(app.state, f"Slice focus {relative:.2f}")
 
 
-def on_mouse_drag(app, mouseX, mouseY) -> None:
-    _ = (app, mouseX, mouseY)
-
+# cmu_graphics only requires these hooks to be callable; a shared no-op
+# keeps drag events (which fire at input-device rate) as cheap as possible.
+_NOOP = lambda *_args: None
 
-def on_mouse_release(app, event) -> None:
-    _ = (app, event)
+on_mouse_drag = _NOOP
+on_mouse_release = _NOOP
 
 
 def timer_fired(app) -> None:
+    if not app.state.is_animating:
+        return
     model.tick_animation(app.state, degrees_per_tick=4.0)
 
 
 def redraw_all(app) -> None:
-    from . import view
-
+    state = app.state
+    # cmu_graphics repaints from scratch every frame, so the view must
+    # still issue its draw calls; the dirty flag lets it reuse cached
+    # geometry (curve, slices, window). That static layer only depends
+    # on these fields — rotation ticks leave it intact.
+    static_sig = (state.current_index, state.x_min, state.x_max, state.slice_count)
+    app.cache["staticDirty"] = static_sig != app.cache.get("staticSig")
+    app.cache["staticSig"] = static_sig
     view.redraw_all(app)
 
 
-def _within(bounds, x, y) -> bool:
-    left, top, width, height = bounds
-    return left <= x <= left + width and top <= y <= top + height
+def _within(box: Box, x, y) -> bool:
+    return box.left <= x <= box.right and box.top <= y <= box.bottom
 
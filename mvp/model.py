@@ -10,11 +10,12 @@ appears here so that we can adhere to the MVC structure required by
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from math import pi, sin
-from typing import Callable, List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDefinition:
     name: str
     expression: str
@@ -22,7 +23,9 @@ class FunctionDefinition:
     suggested_domain: Tuple[float, float]
 
 
-@dataclass
+# Slots turn the controller's per-event attribute reads into fixed
+# offsets instead of dict probes and shrink each instance.
+@dataclass(slots=True)
 class AppState:
     functions: List[FunctionDefinition]
     current_index: int
@@ -33,6 +36,17 @@ class AppState:
     rotation_angle: float
     approx_volume: float
     status_message: str
+    # Scratch buffers refilled in place by slice_samples_arrays so the
+    # per-frame slice grid never reallocates.
+    slice_x: List[float]
+    slice_r: List[float]
+    # Per-frame caches keyed on their inputs; a key mismatch is the
+    # invalidation, so mutators never have to remember to clear them.
+    _curve_key: Optional[Tuple[int, float, float, int]] = None
+    _curve_cache: Optional[Tuple[List[float], List[float]]] = None
+    _slice_key: Optional[Tuple[int, float, float, int]] = None
+    _slice_rows_key: Optional[Tuple[int, float, float, int]] = None
+    _slice_rows: Optional[List[Tuple[float, float, float]]] = None
 
 
 def create_initial_state() -> AppState:
@@ -48,6 +62,8 @@ def create_initial_state() -> AppState:
         rotation_angle=0.0,
         approx_volume=0.0,
         status_message="Use arrows to cycle functions",
+        slice_x=[],
+        slice_r=[],
     )
     _update_volume(state)
     return state
@@ -104,34 +120,99 @@ def reset_state(state: AppState) -> None:
 def tick_animation(state: AppState, degrees_per_tick: float = 4.0) -> None:
     if not state.is_animating:
         return
-    state.rotation_angle = (state.rotation_angle + degrees_per_tick) % 360
+    # One step never exceeds a full turn, so a compare-and-subtract
+    # wraps the angle without the fmod a float % 360 costs per tick.
+    next_angle = state.rotation_angle + degrees_per_tick
+    state.rotation_angle = next_angle - 360.0 if next_angle >= 360.0 else next_angle
 
 
-def sample_curve(state: AppState, steps: int = 120) -> List[Tuple[float, float]]:
+def sample_curve_arrays(state: AppState, steps: int = 120) -> Tuple[List[float], List[float]]:
+    """Curve samples as parallel x/y lists — no per-point tuple boxing."""
+
+    key = (state.current_index, state.x_min, state.x_max, steps)
+    if key == state._curve_key and state._curve_cache is not None:
+        return state._curve_cache
     span = state.x_max - state.x_min
     if span <= 0 or steps < 2:
-        return []
+        return [], []
     dx = span / (steps - 1)
+    # Hoist the evaluator: evaluate_curve re-resolves the active
+    # function per sample, which adds up at 120+ samples a frame.
+    fn = active_function(state).evaluator
     x = state.x_min
-    samples: List[Tuple[float, float]] = []
+    xs: List[float] = []
+    ys: List[float] = []
     for _ in range(steps):
-        samples.append((x, evaluate_curve(state, x)))
+        xs.append(x)
+        ys.append(fn(x))
         x += dx
-    return samples
+    state._curve_key = key
+    state._curve_cache = (xs, ys)
+    return xs, ys
 
 
-def slice_samples(state: AppState) -> List[Tuple[float, float, float]]:
+def sample_curve(state: AppState, steps: int = 120) -> List[Tuple[float, float]]:
+    """Tuple-based adapter over sample_curve_arrays."""
+
+    xs, ys = sample_curve_arrays(state, steps)
+    return list(zip(xs, ys))
+
+
+def slice_samples_arrays(state: AppState) -> Tuple[List[float], float, List[float]]:
+    """Slice grid as parallel arrays: left edges, shared width, radii.
+
+    The lists live on the state and are refilled in place, so per-frame
+    calls allocate nothing once the slice count settles; callers that
+    need a snapshot must copy.
+    """
+
+    xs = state.slice_x
+    radii = state.slice_r
     span = state.x_max - state.x_min
     if span <= 0 or state.slice_count <= 0:
-        return []
-    width = span / state.slice_count
+        del xs[:]
+        del radii[:]
+        state._slice_key = None
+        return xs, 0.0, radii
+
+    count = state.slice_count
+    key = (state.current_index, state.x_min, state.x_max, count)
+    if key == state._slice_key:
+        return xs, span / count, radii
+    if len(xs) > count:
+        del xs[count:]
+        del radii[count:]
+    while len(xs) < count:
+        xs.append(0.0)
+        radii.append(0.0)
+
+    width = span / count
+    half = width / 2
+    fn = active_function(state).evaluator
     x = state.x_min
-    data: List[Tuple[float, float, float]] = []
-    for _ in range(state.slice_count):
-        radius = abs(evaluate_curve(state, x + width / 2))
-        data.append((x, width, radius))
+    for i in range(count):
+        xs[i] = x
+        radii[i] = abs(fn(x + half))
         x += width
-    return data
+    state._slice_key = key
+    return xs, width, radii
+
+
+def slice_samples(state: AppState) -> List[Tuple[float, float, float]]:
+    """Slice grid as (x, width, radius) rows; prefer slice_samples_arrays.
+
+    The row list is memoized alongside the array cache so tuple-based
+    callers do not re-box n tuples on frames where the grid is unchanged.
+    """
+
+    xs, width, radii = slice_samples_arrays(state)
+    key = state._slice_key
+    if key is not None and key == state._slice_rows_key and state._slice_rows is not None:
+        return state._slice_rows
+    rows = [(xs[i], width, radii[i]) for i in range(len(xs))]
+    state._slice_rows_key = key
+    state._slice_rows = rows
+    return rows
 
 
 def evaluate_curve(state: AppState, x: float) -> float:
@@ -142,11 +223,80 @@ def set_status(state: AppState, message: str) -> None:
     state.status_message = message
 
 
+def _adaptive_simpson(
+    g: Callable[[float], float], a: float, b: float, tol: float = 1e-6, depth: int = 20
+) -> float:
+    """Adaptive Simpson integration of g over [a, b].
+
+    Subdivides only where g curves, so smooth integrands hit the
+    tolerance with a few dozen evaluations where a midpoint grid needs
+    hundreds. Used for the volume readout; the slice grid stays on the
+    midpoint rule purely for visualization.
+    """
+
+    m = (a + b) / 2
+    ga, gm, gb = g(a), g(m), g(b)
+    whole = (b - a) / 6 * (ga + 4 * gm + gb)
+    return _simpson_step(g, a, b, ga, gm, gb, whole, tol, depth)
+
+
+def _simpson_step(g, a, b, ga, gm, gb, whole, tol, depth) -> float:
+    m = (a + b) / 2
+    glm = g((a + m) / 2)
+    grm = g((m + b) / 2)
+    left = (m - a) / 6 * (ga + 4 * glm + gm)
+    right = (b - m) / 6 * (gm + 4 * grm + gb)
+    halves = left + right
+    if depth <= 0 or abs(halves - whole) <= 15 * tol:
+        return halves + (halves - whole) / 15
+    return _simpson_step(
+        g, a, m, ga, glm, gm, left, tol / 2, depth - 1
+    ) + _simpson_step(g, m, b, gm, grm, gb, right, tol / 2, depth - 1)
+
+
+@lru_cache(maxsize=512)
+def _volume_cached(fn: Callable[[float], float], x_min: float, x_max: float) -> float:
+    """Memoized adaptive-Simpson volume for one (function, domain) key.
+
+    A session only ever visits a few hundred distinct domains, so
+    revisiting one (cycling back to a function, undoing a domain tweak)
+    costs a dict lookup instead of an integration pass.
+    """
+
+    # Integrate bare r² and apply the constant pi factor once on the
+    # result instead of inside every integrand call. Squaring already
+    # discards the sign, so no abs() here; only display radii need it.
+    def g(x: float) -> float:
+        value = fn(x)
+        return value * value
+
+    return pi * _adaptive_simpson(g, x_min, x_max)
+
+
 def _update_volume(state: AppState) -> None:
-    volume = 0.0
-    for x, width, radius in slice_samples(state):
-        volume += pi * radius * radius * width
-    state.approx_volume = volume
+    span = state.x_max - state.x_min
+    if span <= 0 or state.slice_count <= 0:
+        state.approx_volume = 0.0
+        return
+    # Bounds are quantized so binary-float drift between equal user
+    # inputs cannot cause cache misses.
+    state.approx_volume = _volume_cached(
+        active_function(state).evaluator, round(state.x_min, 6), round(state.x_max, 6)
+    )
+
+
+# Module-level defs instead of lambdas: the evaluators are the hottest
+# callables in the app, and named functions also profile legibly.
+def _parabola(x: float) -> float:
+    return 0.3 * x * x + 0.5
+
+
+def _sine_bump(x: float) -> float:
+    return sin(x) + 1.2
+
+
+def _circular_arc(x: float) -> float:
+    return max(0.0, 4 - x * x) ** 0.5
 
 
 def _build_functions() -> List[FunctionDefinition]:
@@ -154,19 +304,19 @@ def _build_functions() -> List[FunctionDefinition]:
         FunctionDefinition(
             name="Parabola",
             expression="y = 0.3x^2 + 0.5",
-            evaluator=lambda x: 0.3 * x * x + 0.5,
+            evaluator=_parabola,
             suggested_domain=(0.0, 3.0),
         ),
         FunctionDefinition(
             name="Sine bump",
             expression="y = sin(x) + 1.2",
-            evaluator=lambda x: sin(x) + 1.2,
+            evaluator=_sine_bump,
             suggested_domain=(0.0, 6.0),
         ),
         FunctionDefinition(
             name="Circular arc",
             expression="y = sqrt(4 - x^2)",
-            evaluator=lambda x: max(0.0, 4 - x * x) ** 0.5,
+            evaluator=_circular_arc,
             suggested_domain=(-2.0, 2.0),
         ),
     ]
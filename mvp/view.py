@@ -7,12 +7,17 @@ The controller calls `redraw_all` from the main `redrawAll` handler.
 
 from __future__ import annotations
 
-from typing import List, Sequence, Tuple
+from typing import Sequence, Tuple
 
 from cmu_graphics import drawLabel, drawLine, drawPolygon, drawRect
 
 from . import model
 
+# Bound .format skips re-parsing the spec on each call; the angle
+# readout is the one string still formatted every frame, so its
+# template is compiled once here.
+_ANGLE_LABEL = "Angle {:05.1f}°".format
+
 
 def redraw_all(app) -> None:
     if not _ready(app):
@@ -28,7 +33,7 @@ def draw_background(app) -> None:
 
 
 def draw_ribbon(app) -> None:
-    x, y, w, h = app.layout["ribbon"]
+    x, y, w, h = app._ribbon
     drawRect(x, y, w, h, fill=app.colors["ribbon"])
     drawLabel(
         "Disk method visualizer",
@@ -49,37 +54,46 @@ def draw_ribbon(app) -> None:
 
 
 def draw_graph(app) -> None:
-    bounds = app.layout["graph"]
+    bounds = app._graph
     drawRect(*bounds, fill=app.colors["canvas"], border=app.colors["canvasBorder"], borderWidth=2)
-    samples = model.sample_curve(app.state, steps=160)
-    if not samples:
+    xs, ys, window, slices = _graph_geometry(app)
+    if not xs:
         return
-    y_min, y_max = _curve_window(samples)
+    y_min, y_max = window
     _draw_axes(app, bounds, y_min, y_max)
-    _draw_slices(app, bounds, y_min, y_max)
-    _draw_curve(app, bounds, y_min, y_max, samples)
+    _draw_slices(app, bounds, y_min, y_max, slices)
+    _draw_curve(app, bounds, y_min, y_max, xs, ys)
+
+
+def _graph_geometry(app):
+    cache = app.cache
+    if cache.get("staticDirty", True) or "graphGeometry" not in cache:
+        xs, ys = model.sample_curve_arrays(app.state, steps=160)
+        # Window from the full sample set so axes and slices are
+        # unaffected by however many curve points survive decimation.
+        window = _curve_window(ys) if ys else (0.0, 1.0)
+        if xs:
+            xs, ys = _decimate_samples(xs, ys)
+        slices = model.slice_samples_arrays(app.state)
+        cache["graphGeometry"] = (xs, ys, window, slices)
+    return cache["graphGeometry"]
 
 
 def draw_sidebar(app) -> None:
-    x, y, w, h = app.layout["sidebar"]
+    x, y, w, h = app._sidebar
     drawRect(x, y, w, h, fill=app.colors["sidebar"], border=app.colors["canvasBorder"])
     inset = 24
     line = y + inset
     spacing = 28
-    info = [
-        ("Function", model.active_function(app.state).expression),
-        ("Domain", f"[{app.state.x_min:.2f}, {app.state.x_max:.2f}]"),
-        ("Slices", str(app.state.slice_count)),
-        ("Volume", f"{app.state.approx_volume:.3f} units³"),
-        ("Animation", "running" if app.state.is_animating else "paused"),
-        ("Status", app.state.status_message),
-    ]
+    info = _sidebar_info(app)
+    label_color = app.colors["sidebarText"]
+    value_color = app.colors["accent"]
     for label, value in info:
-        drawLabel(label, x + inset, line, align="left", size=14, fill=app.colors["sidebarText"])
-        drawLabel(value, x + inset, line + 16, align="left", size=18, fill=app.colors["accent"])
+        drawLabel(label, x + inset, line, align="left", size=14, fill=label_color)
+        drawLabel(value, x + inset, line + 16, align="left", size=18, fill=value_color)
         line += spacing
     drawLabel(
-        f"Angle {app.state.rotation_angle:05.1f}°",
+        _ANGLE_LABEL(app.state.rotation_angle),
         x + inset,
         y + h - inset,
         align="left",
@@ -88,54 +102,155 @@ def draw_sidebar(app) -> None:
     )
 
 
+def _sidebar_info(app):
+    # The sidebar rows change on user actions, not per frame, so the
+    # formatted strings are keyed on exactly the fields they read. The
+    # angle label is the one per-frame value and stays in draw_sidebar.
+    state = app.state
+    cache = app.cache
+    key = (
+        state.current_index,
+        state.x_min,
+        state.x_max,
+        state.slice_count,
+        state.approx_volume,
+        state.is_animating,
+        state.status_message,
+    )
+    if key != cache.get("sidebarKey"):
+        cache["sidebarInfo"] = [
+            ("Function", model.active_function(state).expression),
+            ("Domain", f"[{state.x_min:.2f}, {state.x_max:.2f}]"),
+            ("Slices", str(state.slice_count)),
+            ("Volume", f"{state.approx_volume:.3f} units³"),
+            ("Animation", "running" if state.is_animating else "paused"),
+            ("Status", state.status_message),
+        ]
+        cache["sidebarKey"] = key
+    return cache["sidebarInfo"]
+
+
 def _draw_axes(app, bounds, y_min, y_max) -> None:
     left, top, width, height = bounds
     axis_color = app.colors["axis"]
     drawLine(left, top, left, top + height, fill=axis_color)
     drawLine(left, top + height, left + width, top + height, fill=axis_color)
     if y_min <= 0 <= y_max:
-        _, zero_y = _project(app, bounds, app.state.x_min, 0, y_min, y_max)
+        # y = 0 projects to ay - 0 * by, i.e. the ay coefficient itself.
+        zero_y = _projection(app, bounds, y_min, y_max)[2]
         drawLine(left, zero_y, left + width, zero_y, fill=axis_color)
 
 
-def _draw_slices(app, bounds, y_min, y_max) -> None:
-    state = app.state
-    for x0, width, radius in model.slice_samples(state):
-        x1 = x0 + width
-        base1 = _project(app, bounds, x0, 0, y_min, y_max)
-        base2 = _project(app, bounds, x1, 0, y_min, y_max)
-        top1 = _project(app, bounds, x0, radius, y_min, y_max)
-        top2 = _project(app, bounds, x1, radius, y_min, y_max)
-        coords = [
-            base1[0],
-            base1[1],
-            top1[0],
-            top1[1],
-            top2[0],
-            top2[1],
-            base2[0],
-            base2[1],
-        ]
-        drawPolygon(
-            *coords,
-            fill=app.colors["slice"],
-            opacity=40,
-            border=app.colors["curve"],
-            borderWidth=1,
-        )
-
-
-def _draw_curve(app, bounds, y_min, y_max, samples: Sequence[Tuple[float, float]]) -> None:
-    for a, b in zip(samples, samples[1:]):
-        ax, ay = _project(app, bounds, a[0], a[1], y_min, y_max)
-        bx, by = _project(app, bounds, b[0], b[1], y_min, y_max)
-        drawLine(ax, ay, bx, by, fill=app.colors["curve"], lineWidth=2)
-
-
-def _curve_window(samples: Sequence[Tuple[float, float]]) -> Tuple[float, float]:
-    ys = [y for _, y in samples]
-    y_min = min(ys)
-    y_max = max(ys)
+def _draw_slices(app, bounds, y_min, y_max, slices) -> None:
+    # cmu_graphics takes one polygon per call, so the call count cannot
+    # shrink — but the corner geometry only moves with the static layer,
+    # so the 8-float rows are rebuilt on staticDirty and replayed
+    # unchanged on every other frame.
+    cache = app.cache
+    if cache.get("staticDirty", True) or "sliceCoords" not in cache:
+        ax, bx, ay, by = _projection(app, bounds, y_min, y_max)
+        x0s, slice_width, radii = slices
+        # The corner rows are scratch buffers overwritten in place, the
+        # same pattern as the model's slice arrays: once the slice count
+        # settles, a rebuild allocates nothing.
+        coords_list = cache.setdefault("sliceCoords", [])
+        count = len(x0s)
+        if len(coords_list) > count:
+            del coords_list[count:]
+        while len(coords_list) < count:
+            coords_list.append([0.0] * 8)
+        _fill_slice_coords(coords_list, x0s, slice_width, radii, ax, bx, ay, by)
+    fill = app.colors["slice"]
+    border = app.colors["curve"]
+    for coords in cache["sliceCoords"]:
+        drawPolygon(*coords, fill=fill, opacity=40, border=border, borderWidth=1)
+
+
+def _fill_slice_coords(coords_list, x0s, slice_width, radii, ax, bx, ay, by) -> None:
+    """Overwrite the scratch rows with projected slice corners.
+
+    Pure arithmetic over plain sequences and scalars — no app or cache
+    access — the same kernel-shaped factoring as the archived build's
+    mesh builder, so profiling it in isolation (or swapping in a
+    compiled implementation) needs no changes at the call site.
+    """
+
+    # All slices share one width, so its projected span is a constant.
+    width_px = slice_width * bx
+    for i in range(len(coords_list)):
+        sx0 = ax + x0s[i] * bx
+        sx1 = sx0 + width_px
+        sy_top = ay - radii[i] * by
+        row = coords_list[i]
+        row[0] = sx0
+        row[1] = ay
+        row[2] = sx0
+        row[3] = sy_top
+        row[4] = sx1
+        row[5] = sy_top
+        row[6] = sx1
+        row[7] = ay
+
+
+def _draw_curve(app, bounds, y_min, y_max, xs: Sequence[float], ys: Sequence[float]) -> None:
+    # Project everything in one batch, then stream the segments with the
+    # previous endpoint carried forward. Like the slice coords, the
+    # projected curve only moves with the static layer, so idle and
+    # rotation-only frames replay the cached list.
+    cache = app.cache
+    if cache.get("staticDirty", True) or "curveCoords" not in cache:
+        cache["curveCoords"] = _project_batch(app, bounds, zip(xs, ys), y_min, y_max)
+    coords = cache["curveCoords"]
+    if not coords:
+        return
+    curve_color = app.colors["curve"]
+    draw_line = drawLine
+    px, py = coords[0]
+    for i in range(1, len(coords)):
+        qx, qy = coords[i]
+        draw_line(px, py, qx, qy, fill=curve_color, lineWidth=2)
+        px, py = qx, qy
+
+
+def _decimate_samples(
+    xs: Sequence[float], ys: Sequence[float]
+) -> Tuple[Sequence[float], Sequence[float]]:
+    """Thin near-straight runs of the sampled curve before projection.
+
+    On the uniform grid the second difference is a curvature proxy, so
+    points are dropped where the polyline is locally straight. Runs are
+    capped at four skips so constant-curvature stretches — where every
+    individual step looks flat — cannot accumulate a visible sag; the
+    cap keeps the chord error under a pixel at the graph's scale.
+    """
+
+    n = len(xs)
+    if n < 3:
+        return xs, ys
+    tol = 5e-4 * (max(ys) - min(ys) or 1.0)
+    kept_x = [xs[0]]
+    kept_y = [ys[0]]
+    gap = 0
+    for i in range(1, n - 1):
+        gap += 1
+        if gap >= 4 or abs(ys[i - 1] - 2.0 * ys[i] + ys[i + 1]) > tol:
+            kept_x.append(xs[i])
+            kept_y.append(ys[i])
+            gap = 0
+    kept_x.append(xs[-1])
+    kept_y.append(ys[-1])
+    return kept_x, kept_y
+
+
+def _curve_window(ys: Sequence[float]) -> Tuple[float, float]:
+    # Single pass over the y values instead of building a list and
+    # scanning it twice; callers guarantee ys is non-empty.
+    y_min = y_max = ys[0]
+    for y in ys:
+        if y < y_min:
+            y_min = y
+        elif y > y_max:
+            y_max = y
     if abs(y_max - y_min) < 1e-3:
         padding = 0.5
         return y_min - padding, y_max + padding
@@ -144,16 +259,38 @@ def _curve_window(samples: Sequence[Tuple[float, float]]) -> Tuple[float, float]
 
 
 def _ready(app) -> bool:
-    return all(hasattr(app, attr) for attr in ("colors", "layout", "state"))
+    # Readiness is monotonic — once app_started has run, the probes can
+    # never fail again — so the first success is latched on the app and
+    # every later frame is a single attribute read.
+    if getattr(app, "_view_ready", False):
+        return True
+    ready = hasattr(app, "colors") and hasattr(app, "layout") and hasattr(app, "state")
+    if ready:
+        app._view_ready = True
+    return ready
+
+
+def _projection(app, bounds, y_min, y_max) -> Tuple[float, float, float, float]:
+    """Affine coefficients (ax, bx, ay, by) matching _project.
 
+    A point maps to (ax + x * bx, ay - y * by); deriving the four
+    scalars once lets batch callers skip _project's per-point state and
+    bounds reads.
+    """
 
-def _project(app, bounds, x, y, y_min, y_max) -> Tuple[float, float]:
     left, top, width, height = bounds
-    span_x = app.state.x_max - app.state.x_min
+    state = app.state
+    span_x = state.x_max - state.x_min
     span_y = y_max - y_min or 1.0
-    rel_x = 0.0 if span_x == 0 else (x - app.state.x_min) / span_x
-    rel_y = (y - y_min) / span_y
-    px = left + rel_x * width
-    py = top + height - rel_y * height
-    return px, py
+    bx = 0.0 if span_x == 0 else width / span_x
+    ax = left - state.x_min * bx
+    by = height / span_y
+    ay = top + height + y_min * by
+    return ax, bx, ay, by
+
+
+def _project_batch(app, bounds, points, y_min, y_max):
+    """Project an iterable of (x, y) pairs in a single pass."""
 
+    ax, bx, ay, by = _projection(app, bounds, y_min, y_max)
+    return [(ax + x * bx, ay - y * by) for x, y in points]